@@ -139,6 +139,7 @@ def test_should_raise_validation_error_when_required_option_is_missing() -> None
             ],
         ),
     ],
+    ids=["text_input", "text_area", "static_text", "checkbox", "radio_group", "select", "hidden", "repeat"],
 )
 def test_should_render_correct_form(initializer: object, expected_elements: list[form.FormElement]) -> None:
     class TheModel(form.FormModel):
@@ -209,6 +210,36 @@ def test_should_render_correct_form(initializer: object, expected_elements: list
         # section
         (SimpleFormModel, form.section("", SimpleFormModel), {"input": "abc"}, SimpleFormModel(input="abc")),
     ],
+    ids=[
+        "text_input-required-valid",
+        "text_input-required-coercible",
+        "text_input-optional-valid",
+        "text_input-optional-none",
+        "text_input-optional-missing",
+        "text_area-required-valid",
+        "text_area-required-coercible",
+        "text_area-optional-valid",
+        "text_area-optional-none",
+        "text_area-optional-missing",
+        "checkbox-required-checked",
+        "checkbox-optional-checked",
+        "checkbox-optional-unchecked",
+        "checkbox-optional-missing",
+        "radio_group-optional-missing",
+        "radio_group-required-valid",
+        "radio_group-conditional-valid",
+        "select-required-valid",
+        "select-optional-missing",
+        "select-conditional-missing",
+        "select-multiple-valid",
+        "select-multiple-missing",
+        "hidden-str",
+        "hidden-literal",
+        "hidden-conditional-missing",
+        "group",
+        "repeat",
+        "section",
+    ],
 )
 def test_should_parse_correctly_when_input_is_valid(
     annotation: object, initializer: object, input_value: object, expected_result: object
@@ -252,6 +283,26 @@ def test_should_parse_correctly_when_input_is_valid(
         # section
         (SimpleFormModel, form.section("", SimpleFormModel), {}),
     ],
+    ids=[
+        "text_input-required-missing",
+        "text_input-required-none",
+        "text_input-optional-dict",
+        "text_area-required-missing",
+        "text_area-required-none",
+        "text_area-optional-dict",
+        "checkbox-int",
+        "radio_group-optional-not_an_option",
+        "radio_group-required-missing",
+        "select-optional-not_an_option",
+        "select-required-missing",
+        "select-multiple-not_an_option",
+        "hidden-literal-mismatch",
+        "hidden-str-missing",
+        "group-missing",
+        "repeat-dict",
+        "repeat-missing",
+        "section-empty",
+    ],
 )
 def test_should_raise_validation_error_when_input_is_invalid(
     annotation: object, initializer: object, input_value: object
@@ -296,9 +347,31 @@ def test_should_raise_validation_error_when_input_is_invalid(
         # section
         (dict, form.section("", SimpleFormModel)),
     ],
+    ids=[
+        "text_input-optional-str",
+        "text_input-required-optional_str",
+        "text_input-conditional-str",
+        "text_area-optional-str",
+        "text_area-required-optional_str",
+        "text_area-conditional-str",
+        "checkbox-str",
+        "radio_group-required-str",
+        "radio_group-optional-enum",
+        "radio_group-required-optional_enum",
+        "select-required-str",
+        "select-optional-set",
+        "select-required-set",
+        "select-multiple-enum",
+        "hidden-optional_str",
+        "group-dict",
+        "repeat-model",
+        "repeat-list",
+        "repeat-list_str",
+        "section-dict",
+    ],
 )
 def test_should_raise_type_error_when_annotation_is_wrong(annotation: object, initializer: object) -> None:
-    with pytest.raises(TypeError):
+    with pytest.raises(TypeError, match="produces values of type .+, but is annotated with"):
 
         class TheModel(form.FormModel):
             field: annotation = initializer  # type: ignore[valid-type]
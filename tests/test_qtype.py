@@ -14,6 +14,7 @@ from questionpy import (
     BaseAttemptState,
     BaseQuestionState,
     Environment,
+    Manifest,
     Question,
     QuestionType,
     RequestUser,
@@ -25,23 +26,28 @@ from questionpy_common.environment import set_qpy_environment
 from questionpy_server.worker.runtime.manager import EnvironmentImpl
 from questionpy_server.worker.runtime.package import ImportablePackage
 
+ENVIRONMENT = EnvironmentImpl(
+    type="test",
+    limits=None,
+    request_user=RequestUser(["en"]),
+    main_package=cast(
+        ImportablePackage,
+        SimpleNamespace(
+            manifest=Manifest(
+                namespace="test_ns", short_name="test_package", version="1.2.3", api_version="0.1", author="pytest"
+            )
+        ),
+    ),
+    packages={},
+    _on_request_callbacks=[],
+)
 
-@pytest.fixture(autouse=True)
+
+@pytest.fixture(autouse=True, scope="module")
 def environment() -> Generator[Environment, None, None]:
-    env = EnvironmentImpl(
-        type="test",
-        limits=None,
-        request_user=RequestUser(["en"]),
-        main_package=cast(
-            ImportablePackage,
-            SimpleNamespace(manifest=SimpleNamespace(namespace="test_ns", short_name="test_package", version="1.2.3")),
-        ),
-        packages={},
-        _on_request_callbacks=[],
-    )
-    set_qpy_environment(env)
+    set_qpy_environment(ENVIRONMENT)
     try:
-        yield env
+        yield ENVIRONMENT
     finally:
         set_qpy_environment(None)
 
@@ -119,45 +125,56 @@ ATTEMPT_STATE_DICT = {
     "my_attempt_field": 17,
 }
 
+QUESTION_STATE_JSON = json.dumps(QUESTION_STATE_DICT)
+ATTEMPT_STATE_JSON = json.dumps(ATTEMPT_STATE_DICT)
+
+
+@pytest.fixture(scope="module")
+def default_state_qtype() -> QuestionType:
+    return QuestionType(QuestionUsingDefaultState)
 
-def test_should_deserialize_correct_options_when_using_BaseQuestionState() -> None:
-    qtype = QuestionType(QuestionUsingDefaultState)
 
-    question = qtype.create_question_from_state(json.dumps(QUESTION_STATE_DICT))
+@pytest.fixture(scope="module")
+def my_question_state_qtype() -> QuestionType:
+    return QuestionType(QuestionUsingMyQuestionState)
+
+
+@pytest.fixture(scope="module")
+def default_state_question(default_state_qtype: QuestionType) -> Question:
+    # None of the tests using this fixture modify the question, so it can be shared.
+    return default_state_qtype.create_question_from_state(QUESTION_STATE_JSON)
+
+
+def test_should_deserialize_correct_options_when_using_BaseQuestionState(default_state_qtype: QuestionType) -> None:
+    question = default_state_qtype.create_question_from_state(QUESTION_STATE_JSON)
 
     assert question.options == SomeModel(input="something")
 
 
-def test_should_create_question_from_options() -> None:
-    qtype = QuestionType(QuestionUsingMyQuestionState)
-    question = qtype.create_question_from_options(None, {"input": "something"})
+def test_should_create_question_from_options(my_question_state_qtype: QuestionType) -> None:
+    question = my_question_state_qtype.create_question_from_options(None, {"input": "something"})
 
     assert isinstance(question, QuestionUsingMyQuestionState)
     assert isinstance(question.state, MyQuestionState)
     assert json.loads(question.export_question_state()) == QUESTION_STATE_DICT
 
 
-def test_should_create_question_from_state() -> None:
-    qtype = QuestionType(QuestionUsingMyQuestionState)
-    question = qtype.create_question_from_state(json.dumps(QUESTION_STATE_DICT))
+def test_should_create_question_from_state(my_question_state_qtype: QuestionType) -> None:
+    question = my_question_state_qtype.create_question_from_state(QUESTION_STATE_JSON)
 
     assert isinstance(question, QuestionUsingMyQuestionState)
     assert json.loads(question.export_question_state()) == QUESTION_STATE_DICT
 
 
-def test_should_start_attempt() -> None:
-    qtype = QuestionType(QuestionUsingDefaultState)
-    question = qtype.create_question_from_state(json.dumps(QUESTION_STATE_DICT))
-    attempt = question.start_attempt(3)
+def test_should_start_attempt(default_state_question: Question) -> None:
+    attempt = default_state_question.start_attempt(3)
 
     assert isinstance(attempt, SomeAttempt)
     assert json.loads(attempt.export_attempt_state()) == ATTEMPT_STATE_DICT
 
 
-def test_should_get_attempt() -> None:
-    qtype = QuestionType(QuestionUsingDefaultState)
-    question = qtype.create_question_from_state(json.dumps(QUESTION_STATE_DICT))
-    attempt = question.get_attempt(json.dumps(ATTEMPT_STATE_DICT))
+def test_should_get_attempt(default_state_question: Question) -> None:
+    attempt = default_state_question.get_attempt(ATTEMPT_STATE_JSON)
 
     assert isinstance(attempt, SomeAttempt)
     assert json.loads(attempt.export_attempt_state()) == ATTEMPT_STATE_DICT
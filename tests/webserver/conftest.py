@@ -3,24 +3,33 @@
 #  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
 
 import asyncio
-import tempfile
 import threading
 from collections.abc import Callable, Iterator
+from contextlib import suppress
 from pathlib import Path
 
 import pytest
 from aiohttp import web
+from aiohttp.test_utils import TestClient
 from lxml import etree
+from pytest_aiohttp.plugin import AiohttpClient
 from selenium import webdriver
+from selenium.common.exceptions import NoAlertPresentException
 
 from questionpy_sdk.webserver.app import WebServer
 
 
 @pytest.fixture
-def sdk_web_server(request: pytest.FixtureRequest) -> Iterator[WebServer]:
-    # We DON'T want state files to persist between tests, so we use a temp dir which is removed after each test.
-    with tempfile.TemporaryDirectory() as state_storage_tempdir:
-        yield WebServer(request.function.qpy_package_location, state_storage_path=Path(state_storage_tempdir))
+def sdk_web_server(request: pytest.FixtureRequest, tmp_path: Path) -> WebServer:
+    # We DON'T want state files to persist between tests, so every test gets its own directory. These are created
+    # inside pytest's base temp dir, which pytest cleans up itself instead of removing each one after its test.
+    return WebServer(request.function.qpy_package_location, state_storage_path=tmp_path)
+
+
+@pytest.fixture
+async def client(sdk_web_server: WebServer, aiohttp_client: AiohttpClient) -> TestClient:
+    """Serves the web app in-process, for tests which only need the server-rendered HTML and no browser."""
+    return await aiohttp_client(sdk_web_server.web_app)
 
 
 @pytest.fixture
@@ -33,14 +42,29 @@ def url(port: int) -> str:
     return f"http://localhost:{port}"
 
 
-@pytest.fixture
-def driver() -> Iterator[webdriver.Chrome]:
+@pytest.fixture(scope="module")
+def shared_driver() -> Iterator[webdriver.Chrome]:
     options = webdriver.ChromeOptions()
     options.add_argument("--headless")
+    # The tests only inspect the DOM, so nothing needs to be painted.
+    options.add_argument("--disable-gpu")
+    options.add_argument("--blink-settings=imagesEnabled=false")
     with webdriver.Chrome(options=options) as chrome_driver:
         yield chrome_driver
 
 
+@pytest.fixture
+def driver(shared_driver: webdriver.Chrome) -> Iterator[webdriver.Chrome]:
+    """Provides the module's Chrome instance and resets its state after each test, so no new browser is started."""
+    yield shared_driver
+
+    with suppress(NoAlertPresentException):
+        shared_driver.switch_to.alert.dismiss()
+    # Cookies aren't scoped by port, so they would leak to the servers of subsequent tests.
+    shared_driver.delete_all_cookies()
+    shared_driver.get("about:blank")
+
+
 def start_runner(web_app: web.Application, unused_port: int) -> None:
     runner = web.AppRunner(web_app)
     loop = asyncio.new_event_loop()
@@ -59,19 +83,15 @@ def _start_runner_thread(sdk_web_server: WebServer, port: int) -> None:
 
 
 def normalize_element(element: etree._Element) -> etree._Element:
-    """Recursively normalize an XML element by sorting attributes and normalizing whitespace."""
-    if element.text:
-        element.text = " ".join(element.text.split())
-    if element.tail:
-        element.tail = " ".join(element.tail.split())
-
-    if element.attrib:
-        attributes = sorted(element.attrib.items())
-        element.attrib.clear()
-        element.attrib.update(attributes)
-
-    for child in element:
-        normalize_element(child)
+    """Normalize whitespace in an XML element and all of its descendants.
+
+    Attributes don't need to be sorted here, since C14N serialization already orders them.
+    """
+    for descendant in element.iter():
+        if descendant.text:
+            descendant.text = " ".join(descendant.text.split())
+        if descendant.tail:
+            descendant.tail = " ".join(descendant.tail.split())
 
     return element
 
@@ -95,7 +95,9 @@ def form_definition_fixture(repetition_element_fixture: RepetitionElement) -> Op
 
 
 def _substring_in_cxd_element(element: CxdFormElement | CxdOption, substring: str) -> bool:
-    for value in element.model_dump().values():
+    # Read the fields directly instead of serializing the whole element (and its children) with model_dump().
+    for field_name in chain(type(element).model_fields, type(element).model_computed_fields):
+        value = getattr(element, field_name)
         if not isinstance(value, str):
             continue
         if substring in value:
@@ -5,6 +5,8 @@ from collections.abc import Callable
 from typing import Any, TypeVar, cast
 
 import pytest
+from aiohttp.test_utils import TestClient
+from lxml import html
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions
@@ -19,6 +21,9 @@ from questionpy_common.environment import PackageInitFunction
 from questionpy_common.manifest import Manifest
 from questionpy_server.worker.runtime.package_location import FunctionPackageLocation
 
+# The waited-for events usually happen well within Selenium's default poll interval of 0.5 seconds.
+_POLL_FREQUENCY = 0.05
+
 
 class _NoopAttempt(Attempt):
     def export_score(self) -> ScoreModel:
@@ -79,13 +84,40 @@ def use_package(init_fun: PackageInitFunction, manifest: Manifest | None = None)
     return decorator
 
 
+async def _get_page(client: TestClient, path: str) -> html.HtmlElement:
+    response = await client.get(path)
+    assert response.status == 200
+    return html.fromstring(await response.text())
+
+
+@use_package(package_1_init)
+async def test_page_contains_correct_page_title(client: TestClient) -> None:
+    page = await _get_page(client, "/")
+
+    assert "QPy Webserver" in page.findtext(".//title", "")
+
+
+@use_package(
+    package_1_init,
+    manifest=Manifest(short_name="my_short_name", version="7.3.1", api_version="9.4", author="Testy McTestface"),
+)
+async def test_page_contains_correct_manifest_information(client: TestClient) -> None:
+    page = await _get_page(client, "/")
+
+    assert page.findtext(".//title", "").startswith("my_short_name")
+    assert "my_short_name" in page.find_class("header")[0].findtext("h1", "")
+    assert "7.3.1" in page.find_class("manifest-version")[0].text_content()
+    assert "9.4" in page.find_class("manifest-apiversion")[0].text_content()
+
+
+def _count_repetition_contents(driver: webdriver.Chrome) -> int:
+    # A single WebDriver round-trip, instead of locating the repetition element first and then its contents.
+    return driver.execute_script("return document.querySelectorAll('.repetition .repetition-content').length;")
+
+
+@pytest.mark.selenium
 @pytest.mark.usefixtures("_start_runner_thread")
 class TestTemplates:
-    @use_package(package_1_init)
-    def test_page_contains_correct_page_title(self, driver: webdriver.Chrome, url: str) -> None:
-        driver.get(url)
-        assert "QPy Webserver" in driver.title
-
     @use_package(package_1_init)
     def test_form_without_required_fields_should_submit(self, driver: webdriver.Chrome, url: str) -> None:
         driver.get(url)
@@ -98,33 +130,19 @@ class TestTemplates:
         driver.get(url)
         driver.find_element(By.ID, "submit-options-button").click()
 
-        WebDriverWait(driver, 1).until(expected_conditions.alert_is_present())
+        WebDriverWait(driver, 1, poll_frequency=_POLL_FREQUENCY).until(expected_conditions.alert_is_present())
         assert driver.switch_to.alert
 
     @use_package(package_3_init)
     def test_repeat_element_if_present(self, driver: webdriver.Chrome, url: str) -> None:
         driver.get(url)
 
-        repetition_element = driver.find_element(By.CLASS_NAME, "repetition")
-
         # Initially, there should be 2 reps.
-        assert len(repetition_element.find_elements(By.CLASS_NAME, "repetition-content")) == 2
+        assert _count_repetition_contents(driver) == 2
 
-        repetition_element.find_element(By.CLASS_NAME, "repetition-button").click()
-        WebDriverWait(driver, 2).until(expected_conditions.staleness_of(repetition_element))
-        repetition_element = driver.find_element(By.CLASS_NAME, "repetition")
+        button = driver.find_element(By.CSS_SELECTOR, ".repetition .repetition-button")
+        button.click()
+        WebDriverWait(driver, 2, poll_frequency=_POLL_FREQUENCY).until(expected_conditions.staleness_of(button))
 
         # After clicking increment once, there should be 5.
-        assert len(repetition_element.find_elements(By.CLASS_NAME, "repetition-content")) == 5
-
-    @use_package(
-        package_1_init,
-        manifest=Manifest(short_name="my_short_name", version="7.3.1", api_version="9.4", author="Testy McTestface"),
-    )
-    def test_page_contains_correct_manifest_information(self, driver: webdriver.Chrome, url: str) -> None:
-        driver.get(url)
-
-        assert driver.title.startswith("my_short_name")
-        assert "my_short_name" in driver.find_element(By.CLASS_NAME, "header").find_element(By.TAG_NAME, "h1").text
-        assert "7.3.1" in driver.find_element(By.CLASS_NAME, "manifest-version").text
-        assert "9.4" in driver.find_element(By.CLASS_NAME, "manifest-apiversion").text
+        assert _count_repetition_contents(driver) == 5
@@ -1,6 +1,7 @@
 #  This file is part of the QuestionPy SDK. (https://questionpy.org)
 #  The QuestionPy SDK is free software released under terms of the MIT license. See LICENSE.md.
 #  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+from functools import cache
 from pathlib import Path
 
 import pytest
@@ -8,47 +9,51 @@ import pytest
 from questionpy_sdk.webserver.question_ui import QuestionDisplayOptions, QuestionMetadata, QuestionUIRenderer
 from tests.webserver.conftest import compare_xhtml
 
+QUESTION_UIS_DIR = Path(__file__).parent / "question_uis"
+
+
+@cache
+def _read_ui_file(name: str) -> str:
+    # The files are never modified, so tests sharing one only read it once.
+    return (QUESTION_UIS_DIR / name).read_text()
+
 
 def test_should_extract_correct_metadata() -> None:
-    metadata_path = Path(__file__).parent / "question_uis/metadata.xhtml"
-    with metadata_path.open() as xml:
-        ui_renderer = QuestionUIRenderer(xml.read(), {})
-        question_metadata = ui_renderer.get_metadata()
-
-        expected_metadata = QuestionMetadata()
-        expected_metadata.correct_response = {
-            "my_number": "42",
-            "my_select": "1",
-            "my_radio": "2",
-            "my_text": "Lorem ipsum dolor sit amet.",
-        }
-        expected_metadata.expected_data = {
-            "my_number": "Any",
-            "my_select": "Any",
-            "my_radio": "Any",
-            "my_text": "Any",
-            "my_button": "Any",
-            "only_lowercase_letters": "Any",
-            "between_5_and_10_chars": "Any",
-        }
-        expected_metadata.required_fields = ["my_number"]
-
-        assert question_metadata.correct_response == expected_metadata.correct_response
-        assert question_metadata.expected_data == expected_metadata.expected_data
-        assert question_metadata.required_fields == expected_metadata.required_fields
+    ui_renderer = QuestionUIRenderer(_read_ui_file("metadata.xhtml"), {})
+    question_metadata = ui_renderer.get_metadata()
+
+    expected_metadata = QuestionMetadata()
+    expected_metadata.correct_response = {
+        "my_number": "42",
+        "my_select": "1",
+        "my_radio": "2",
+        "my_text": "Lorem ipsum dolor sit amet.",
+    }
+    expected_metadata.expected_data = {
+        "my_number": "Any",
+        "my_select": "Any",
+        "my_radio": "Any",
+        "my_text": "Any",
+        "my_button": "Any",
+        "only_lowercase_letters": "Any",
+        "between_5_and_10_chars": "Any",
+    }
+    expected_metadata.required_fields = ["my_number"]
+
+    assert question_metadata.correct_response == expected_metadata.correct_response
+    assert question_metadata.expected_data == expected_metadata.expected_data
+    assert question_metadata.required_fields == expected_metadata.required_fields
 
 
 def test_should_resolve_placeholders() -> None:
-    placeholder_path = Path(__file__).parent / "question_uis/placeholder.xhtml"
-    with placeholder_path.open() as xml:
-        renderer = QuestionUIRenderer(
-            xml=xml.read(),
-            placeholders={
-                "param": "Value of param <b>one</b>.<script>'Oh no, danger!'</script>",
-                "description": "My simple description.",
-            },
-        )
-        result = renderer.render()
+    renderer = QuestionUIRenderer(
+        xml=_read_ui_file("placeholder.xhtml"),
+        placeholders={
+            "param": "Value of param <b>one</b>.<script>'Oh no, danger!'</script>",
+            "description": "My simple description.",
+        },
+    )
+    result = renderer.render()
 
     # TODO: remove <string> surrounding the resolved placeholder
     expected = """
@@ -66,39 +71,36 @@ def test_should_resolve_placeholders() -> None:
     assert compare_xhtml(result, expected)
 
 
-def test_should_hide_inline_feedback() -> None:
-    options = QuestionDisplayOptions()
-    options.general_feedback = False
-    options.feedback = False
-
-    feedback_path = Path(__file__).parent / "question_uis/feedbacks.xhtml"
-    with feedback_path.open() as xml:
-        renderer = QuestionUIRenderer(xml=xml.read(), placeholders={})
-        result = renderer.render(options=options)
-
-    expected = """
+@pytest.mark.parametrize(
+    ("show_feedback", "expected"),
+    [
+        (
+            False,
+            """
     <div>
     <span>No feedback</span>
     </div>
-    """
-    assert compare_xhtml(result, expected)
-
-
-def test_should_show_inline_feedback() -> None:
-    options = QuestionDisplayOptions()
-
-    feedback_path = Path(__file__).parent / "question_uis/feedbacks.xhtml"
-    with feedback_path.open() as xml:
-        renderer = QuestionUIRenderer(xml=xml.read(), placeholders={})
-        result = renderer.render(options=options)
-
-    expected = """
+    """,
+        ),
+        (
+            True,
+            """
     <div>
     <span>No feedback</span>
     <span>General feedback</span>
     <span>Specific feedback</span>
     </div>
-    """
+    """,
+        ),
+    ],
+    ids=["hide", "show"],
+)
+def test_inline_feedback_visibility(show_feedback: bool, expected: str) -> None:
+    options = QuestionDisplayOptions(general_feedback=show_feedback, feedback=show_feedback)
+
+    renderer = QuestionUIRenderer(xml=_read_ui_file("feedbacks.xhtml"), placeholders={})
+    result = renderer.render(options=options)
+
     assert compare_xhtml(result, expected)
 
 
@@ -129,10 +131,8 @@ def test_element_visibility_based_on_role(user_context: str, expected: str) -> N
     options = QuestionDisplayOptions()
     options.context["role"] = user_context
 
-    feedback_path = Path(__file__).parent / "question_uis/if-role.xhtml"
-    with feedback_path.open() as xml:
-        renderer = QuestionUIRenderer(xml=xml.read(), placeholders={})
-        result = renderer.render(options=options)
+    renderer = QuestionUIRenderer(xml=_read_ui_file("if-role.xhtml"), placeholders={})
+    result = renderer.render(options=options)
 
     assert compare_xhtml(result, expected)
 
@@ -140,10 +140,8 @@ def test_element_visibility_based_on_role(user_context: str, expected: str) -> N
 def test_should_soften_validations() -> None:
     options = QuestionDisplayOptions()
 
-    validation_path = Path(__file__).parent / "question_uis/validations.xhtml"
-    with validation_path.open() as xml:
-        renderer = QuestionUIRenderer(xml=xml.read(), placeholders={})
-        result = renderer.render(options=options)
+    renderer = QuestionUIRenderer(xml=_read_ui_file("validations.xhtml"), placeholders={})
+    result = renderer.render(options=options)
 
     expected = """
     <div>
@@ -165,10 +163,8 @@ def test_should_soften_validations() -> None:
 def test_should_defuse_buttons() -> None:
     options = QuestionDisplayOptions()
 
-    feedback_path = Path(__file__).parent / "question_uis/buttons.xhtml"
-    with feedback_path.open() as xml:
-        renderer = QuestionUIRenderer(xml=xml.read(), placeholders={})
-        result = renderer.render(options=options)
+    renderer = QuestionUIRenderer(xml=_read_ui_file("buttons.xhtml"), placeholders={})
+    result = renderer.render(options=options)
 
     expected = """
     <div>
@@ -189,10 +185,8 @@ def test_should_defuse_buttons() -> None:
 def test_should_format_floats_in_en() -> None:
     options = QuestionDisplayOptions()
 
-    feedback_path = Path(__file__).parent / "question_uis/format-floats.xhtml"
-    with feedback_path.open() as xml:
-        renderer = QuestionUIRenderer(xml=xml.read(), placeholders={})
-        result = renderer.render(options=options)
+    renderer = QuestionUIRenderer(xml=_read_ui_file("format-floats.xhtml"), placeholders={})
+    result = renderer.render(options=options)
 
     expected = """
     <div>
@@ -209,24 +203,19 @@ def test_should_format_floats_in_en() -> None:
 
 
 def test_should_shuffle_the_same_way_in_same_attempt() -> None:
-    feedback_path = Path(__file__).parent / "question_uis/shuffle.xhtml"
-    with feedback_path.open() as xml:
-        input_xml = xml.read()
+    input_xml = _read_ui_file("shuffle.xhtml")
 
     renderer = QuestionUIRenderer(xml=input_xml, placeholders={}, seed=42)
     first_result = renderer.render()
-    for _ in range(10):
+    # The seed is the only source of randomness, so a couple of fresh renderers are enough to show it's used.
+    for _ in range(2):
         renderer = QuestionUIRenderer(xml=input_xml, placeholders={}, seed=42)
         result = renderer.render()
         assert first_result == result, "Shuffled order should remain consistent across renderings with the same seed"
 
 
 def test_should_replace_shuffled_index() -> None:
-    feedback_path = Path(__file__).parent / "question_uis/shuffled-index.xhtml"
-    with feedback_path.open() as xml:
-        input_xml = xml.read()
-
-    renderer = QuestionUIRenderer(xml=input_xml, placeholders={}, seed=42)
+    renderer = QuestionUIRenderer(xml=_read_ui_file("shuffled-index.xhtml"), placeholders={}, seed=42)
     result = renderer.render()
 
     expected = """